@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+import orjson
+import pytest
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+BASE_URL = "http://localhost:9000"
+TIMEOUT = 30
+CACHE_FILE = Path(__file__).with_name(".testsprite_cache.json")
+# Keys a block's hash may be returned under, in priority order; the node's Block JSON
+# is untagged, so it currently comes back as "Hash"
+BLOCK_HASH_KEYS = ("Hash", "hash", "block_hash", "blockHash", "id", "blockId")
+# How long a funded address recorded in the on-disk cache is reused before funding a new one
+FUNDED_TTL = 3600
+# For POSTs whose body is pre-serialized with orjson.dumps and sent as content=
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One pooled, keep-alive client shared by every TC so repeated calls to the
+# local backend reuse connections instead of opening a new one each time.
+# HTTP/2 is negotiated via ALPN, so it only kicks in against an https BASE_URL;
+# the plain-http local node stays on HTTP/1.1 keep-alive. No socket_options are
+# needed for Nagle: httpcore sets TCP_NODELAY on every connection it opens (and
+# asyncio does the same for async_client), so small JSON requests are not delayed.
+CLIENT = httpx.Client(
+    base_url=BASE_URL,
+    timeout=TIMEOUT,
+    headers={"Accept": "application/json"},
+    transport=httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=8),
+        retries=3,
+    ),
+)
+
+_get_cache = {}
+_get_locks = {}
+_get_locks_guard = threading.Lock()
+
+
+# Probes that only check a status code still use GET: the echo router answers HEAD on
+# GET-only routes with 405, and closing a streamed GET before reading its (tiny) error
+# body makes httpx drop the keep-alive connection, which costs more than the bytes saved.
+@pytest.fixture(scope="session")
+def client():
+    """The shared CLIENT; tests address the backend by paths relative to BASE_URL."""
+    return CLIENT
+
+
+@pytest.fixture(scope="session")
+def genesis_hashes(client):
+    """
+    Return (genesis_hash, mutated_hash) for the genesis block at height 0, where mutated_hash
+    is the same hash with its last character flipped: well-formed, but matching no block.
+    The genesis block never changes, so both are cached on disk per BASE_URL and the
+    discovery GET only runs the first time. Both are None if no hash could be extracted.
+    """
+    cached = load_cache(BASE_URL)
+    if "genesis_hash" in cached and "mutated_hash" in cached:
+        return cached["genesis_hash"], cached["mutated_hash"]
+
+    # Since no direct "/block/latest" in doc, try "0" height assuming Genesis block is 0.
+    block_data = get_json("/block/0")
+    assert isinstance(block_data, dict), "Response is not a JSON object"
+
+    # Extract the block hash from the first known key holding a hash-like string (>= 20 chars)
+    genesis_hash = next(
+        (block_data[k] for k in BLOCK_HASH_KEYS if isinstance(block_data.get(k), str) and len(block_data[k]) >= 20),
+        None,
+    )
+    if not genesis_hash:
+        # No valid block hash found, log but continue testing other cases
+        print("Warning: No valid block hash extracted from block data to test GET by hash.")
+        return None, None
+
+    mutated_hash = genesis_hash[:-1] + ("0" if genesis_hash[-1] != "0" else "1")
+    update_cache(BASE_URL, genesis_hash=genesis_hash, mutated_hash=mutated_hash)
+    return genesis_hash, mutated_hash
+
+
+@pytest.fixture(scope="session")
+def funded_address(client):
+    """
+    Create a new token holder by transferring tokens to a freshly generated address.
+    Done once per session and returns (address, transferred_amount) to every balance check.
+    The result is cached on disk, so runs within FUNDED_TTL skip the transfer entirely.
+    No cleanup is possible since a token transfer is blockchain state.
+    """
+    funded = load_cache(BASE_URL).get("funded")
+    if funded and funded["ts"] >= time.time() - FUNDED_TTL:
+        # Still trust the cache only if the node kept the balance (it may have been restarted)
+        resp = client.get(f"/dao/token/balance/{funded['address']}")
+        if resp.status_code == 200 and rjson(resp).get("balance", 0) >= funded["amount"]:
+            return funded["address"], funded["amount"]
+
+    # In real scenario, generating a wallet/address should be done properly; here we simulate a random test address.
+    test_address = f"testaddress_{uuid.uuid4().hex[:16]}"  # synthetic test address
+
+    # Transfer tokens from a known address with private_key (we simulate it here).
+    source_private_key = "test_private_key_for_source"  # Placeholder: Replace with valid key for actual testing
+    transfer_amount = 100
+
+    transfer_payload = {
+        "to": test_address,
+        "amount": transfer_amount,
+        "private_key": source_private_key
+    }
+    transfer_response = client.post("/dao/token/transfer", content=orjson.dumps(transfer_payload), headers=JSON_HEADERS)
+    assert transfer_response.status_code == 200, f"Token transfer failed: {transfer_response.text}"
+
+    update_cache(BASE_URL, funded={"address": test_address, "amount": transfer_amount, "ts": time.time()})
+    return test_address, transfer_amount
+
+
+def async_client():
+    """Return an httpx.AsyncClient for TCs that fan out independent requests with asyncio.gather."""
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        http2=True,
+        headers={"Accept": "application/json"},
+    )
+
+
+def rjson(resp):
+    """Decode a response body with orjson, which is several times faster than resp.json()."""
+    return orjson.loads(resp.content)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.05, max=0.5),
+    retry=retry_if_exception_type(httpx.TransportError),
+    reraise=True,
+)
+def get_json(url):
+    """GET url through CLIENT and return the decoded body.
+
+    Transient network failures are retried with backoff; a non-2xx status raises
+    httpx.HTTPStatusError straight away.
+    """
+    resp = CLIENT.get(url)
+    resp.raise_for_status()
+    return rjson(resp)
+
+
+def cached_get(url, ttl=2.0):
+    """GET url through CLIENT, sharing the response with identical calls made within ttl seconds.
+
+    Callers racing on the same url wait for the one in-flight request instead of
+    issuing their own. Pass ttl=0 when fresh state is required; the new response
+    then replaces the shared one.
+    """
+    with _get_locks_guard:
+        lock = _get_locks.setdefault(url, threading.Lock())
+    with lock:
+        entry = _get_cache.get(url)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        resp = CLIENT.get(url)
+        _get_cache[url] = (time.monotonic(), resp)
+        return resp
+
+
+def load_cache(base_url):
+    """Return the cached values recorded for base_url, or an empty dict if there are none."""
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f).get(base_url, {})
+    except (OSError, ValueError):
+        return {}
+
+
+def update_cache(base_url, **values):
+    """Merge values into the cache entry for base_url.
+
+    The file is re-read right before writing and swapped in atomically, so xdist
+    workers updating different keys at worst lose an entry and re-fetch it next run.
+    """
+    try:
+        with open(CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cache.setdefault(base_url, {}).update(values)
+    tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}")
+    with open(tmp, "w") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp, CACHE_FILE)